@@ -1,19 +1,48 @@
 import csv
+import heapq
 import os
 import shutil
+import sys
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional
 from collections import defaultdict
+from operator import attrgetter, itemgetter
+
+_by_amount = attrgetter('amount')
+_by_date = attrgetter('date')
 
 class Expense:
     
+    __slots__ = ('amount', 'category', 'date', 'description', '_year', '_month', '_desc_lower')
+    
     CATEGORIES = ['Food', 'Transport', 'Entertainment', 'Shopping', 'Utilities', 'Healthcare', 'Education', 'Other']
+    CATEGORIES_SET = frozenset(CATEGORIES)
     
     def __init__(self, amount: float, category: str, date: str, description: str):
         self.amount = self._validate_amount(amount)
-        self.category = self._validate_category(category)
+        self.category = sys.intern(self._validate_category(category))
         self.date = self._validate_date(date)
         self.description = description.strip()
+        self._desc_lower = self.description.lower()
+    
+    @classmethod
+    def from_trusted(cls, amount: str, category: str, date: str, description: str) -> 'Expense':
+        """Build an expense from a row this application wrote, skipping full validation"""
+        if (len(date) != 10 or date[4] != '-' or date[7] != '-'
+                or category not in cls.CATEGORIES_SET or description != description.strip()):
+            raise ValueError("Row needs full validation")
+        dt = datetime.fromisoformat(date)
+        expense = object.__new__(cls)
+        expense.amount = round(float(amount), 2)
+        if not expense.amount > 0:
+            raise ValueError("Row needs full validation")
+        expense.category = sys.intern(category)
+        expense.date = date
+        expense._year, expense._month = dt.year, dt.month
+        expense.description = description
+        expense._desc_lower = description.lower()
+        return expense
     
     def _validate_amount(self, amount) -> float:
         try:
@@ -25,15 +54,25 @@ class Expense:
             raise ValueError("Invalid amount. Must be a positive number.")
     
     def _validate_category(self, category: str) -> str:
+        if category in self.CATEGORIES_SET:
+            return category
         cat = category.strip().title()
-        if cat not in self.CATEGORIES:
+        if cat not in self.CATEGORIES_SET:
             raise ValueError(f"Invalid category. Choose from: {', '.join(self.CATEGORIES)}")
         return cat
     
     def _validate_date(self, date: str) -> str:
         try:
-            datetime.strptime(date, '%Y-%m-%d')
-            return date
+            if len(date) == 10 and date[4] == '-' and date[7] == '-':
+                # Already canonical: fromisoformat is a C fast path, unlike strptime
+                dt = datetime.fromisoformat(date)
+                self._year, self._month = dt.year, dt.month
+                return date
+            dt = datetime.strptime(date, '%Y-%m-%d')
+            self._year, self._month = dt.year, dt.month
+            # strptime accepts unpadded fields; store the zero-padded form so
+            # date strings sort chronologically
+            return dt.strftime('%Y-%m-%d')
         except ValueError:
             raise ValueError("Invalid date format. Use YYYY-MM-DD")
     
@@ -51,9 +90,14 @@ class Expense:
 class FileManager:
     """Handles all file operations for expense data"""
     
+    HEADER = ['Date', 'Category', 'Amount', 'Description']
+    
     def __init__(self, filename: str = 'expenses.csv', backup_dir: str = 'backups'):
         self.filename = filename
         self.backup_dir = backup_dir
+        # Whether the file on disk is known to start with HEADER, so new rows
+        # can be appended in HEADER order; set by load and save
+        self.has_standard_header = False
         self._ensure_data_directory()
     
     def _ensure_data_directory(self):
@@ -61,40 +105,123 @@ class FileManager:
         os.makedirs(os.path.dirname(self.filename) if os.path.dirname(self.filename) else '.', exist_ok=True)
         os.makedirs(self.backup_dir, exist_ok=True)
     
+    @staticmethod
+    def _copy_replace(src: str, dst: str):
+        """Copy src to a temp file and rename it over dst, never writing dst in place"""
+        tmp = dst + '.tmp'
+        try:
+            shutil.copy2(src, tmp)
+            os.replace(tmp, dst)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    
+    def _detach_from_backups(self):
+        """Give the data file its own copy if a hardlinked backup still shares it"""
+        if os.path.exists(self.filename) and os.stat(self.filename).st_nlink > 1:
+            self._copy_replace(self.filename, self.filename)
+    
     def save_expenses(self, expenses: List[Expense]) -> bool:
         """Save all expenses to CSV file"""
         try:
-            with open(self.filename, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow(['Date', 'Category', 'Amount', 'Description'])
-                for expense in expenses:
-                    writer.writerow([expense.date, expense.category, expense.amount, expense.description])
+            # Write a fresh file and rename it into place, so a crash mid-write
+            # leaves the previous data (and any hardlinked backup) intact
+            tmp = self.filename + '.tmp'
+            try:
+                with open(tmp, 'w', newline='', encoding='utf-8', buffering=1 << 20) as file:
+                    writer = csv.writer(file)
+                    writer.writerow(self.HEADER)
+                    writer.writerows((expense.date, expense.category, expense.amount, expense.description)
+                                     for expense in expenses)
+                # A fresh file gets umask permissions; keep the ledger's own
+                if os.path.exists(self.filename):
+                    shutil.copymode(self.filename, tmp)
+                os.replace(tmp, self.filename)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            self.has_standard_header = True
             return True
         except Exception as e:
             print(f"❌ Error saving expenses: {e}")
             return False
     
+    def _ends_with_newline(self) -> bool:
+        """Check whether the data file's last byte is a line break"""
+        with open(self.filename, 'rb') as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) in (b'\n', b'\r')
+    
+    def append_expense(self, expense: Expense) -> bool:
+        """Append a single expense to the CSV file"""
+        try:
+            self._detach_from_backups()
+            with open(self.filename, 'a', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                if file.tell() == 0:
+                    writer.writerow(self.HEADER)
+                elif not self._ends_with_newline():
+                    # A hand-edited file may lack its final line break; without
+                    # one the new row would be glued onto the last record
+                    file.write('\r\n')
+                writer.writerow([expense.date, expense.category, expense.amount, expense.description])
+            return True
+        except Exception as e:
+            print(f"❌ Error saving expense: {e}")
+            return False
+    
     def load_expenses(self) -> List[Expense]:
         """Load expenses from CSV file"""
         expenses = []
+        self.has_standard_header = False
         if not os.path.exists(self.filename):
+            self.has_standard_header = True
             return expenses
         
         try:
-            with open(self.filename, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
+            with open(self.filename, 'r', newline='', encoding='utf-8', buffering=1 << 20) as file:
+                reader = csv.reader(file)
+                # Rows under our own header were written by save/append and
+                # can skip validation; anything else is checked in full
+                header = next(reader, None)
+                trusted = header == self.HEADER
+                # Other headers may order the columns differently, so find
+                # each one by name
+                columns = None
+                needed = len(self.HEADER)
+                if header is not None and not trusted:
+                    columns = [header.index(name) for name in self.HEADER]
+                    needed = max(columns) + 1
+                # An empty file gets HEADER written by the first append
+                self.has_standard_header = header is None or trusted
                 for row in reader:
+                    if not row:
+                        continue
                     try:
-                        expense = Expense(
-                            amount=row['Amount'],
-                            category=row['Category'],
-                            date=row['Date'],
-                            description=row['Description']
-                        )
+                        # Extra trailing fields are ignored, as DictReader did
+                        if len(row) < needed:
+                            raise ValueError(f"expected {needed} fields, got {len(row)}")
+                        if columns is not None:
+                            row = [row[i] for i in columns]
+                        date, category, amount, description = row[:4]
+                        expense = None
+                        if trusted:
+                            try:
+                                expense = Expense.from_trusted(amount, category, date, description)
+                            except ValueError:
+                                pass
+                        if expense is None:
+                            expense = Expense(
+                                amount=amount,
+                                category=category,
+                                date=date,
+                                description=description
+                            )
                         expenses.append(expense)
                     except ValueError as e:
                         print(f"⚠️  Warning: Skipping invalid entry - {e}")
         except Exception as e:
+            self.has_standard_header = False
             print(f"❌ Error loading expenses: {e}")
         
         return expenses
@@ -108,7 +235,17 @@ class FileManager:
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_file = os.path.join(self.backup_dir, f'expenses_backup_{timestamp}.csv')
-            shutil.copy2(self.filename, backup_file)
+            # A hardlink is an instant snapshot as long as the data file is
+            # never modified in place while shared; every writer detaches first
+            try:
+                os.link(self.filename, backup_file)
+            except FileExistsError:
+                # A second backup within the same second: an existing link is
+                # already this snapshot, otherwise refresh it like a plain copy
+                if not os.path.samefile(self.filename, backup_file):
+                    self._copy_replace(self.filename, backup_file)
+            except OSError:
+                shutil.copy2(self.filename, backup_file)
             print(f"✅ Backup created: {backup_file}")
             return True
         except Exception as e:
@@ -123,7 +260,9 @@ class FileManager:
             return False
         
         try:
-            shutil.copy2(backup_path, self.filename)
+            # Copying over the data file in place would also rewrite any backup
+            # hardlinked to it, so swap in a fresh copy instead
+            self._copy_replace(backup_path, self.filename)
             print(f"✅ Data restored from: {backup_filename}")
             return True
         except Exception as e:
@@ -133,58 +272,116 @@ class FileManager:
     def list_backups(self) -> List[str]:
         """List all available backup files"""
         try:
-            backups = [f for f in os.listdir(self.backup_dir) if f.startswith('expenses_backup_')]
-            return sorted(backups, reverse=True)
+            with os.scandir(self.backup_dir) as entries:
+                backups = [entry.name for entry in entries
+                           if entry.name.startswith('expenses_backup_') and entry.is_file(follow_symlinks=False)]
+            # Names embed a fixed-width %Y%m%d_%H%M%S stamp, so reverse
+            # lexical order is newest first without parsing the timestamps
+            backups.sort(reverse=True)
+            return backups
         except Exception:
             return []
 
 
+class ExpenseIndex:
+    """Secondary indexes over an expense list for fast lookups"""
+    
+    def __init__(self, expenses: List[Expense]):
+        self.by_category = defaultdict(list)
+        for i, exp in enumerate(expenses):
+            self.by_category[exp.category].append(i)
+        
+        dates = [exp.date for exp in expenses]
+        self.date_sorted_idx = sorted(range(len(dates)), key=dates.__getitem__)
+        self.dates_sorted = [dates[i] for i in self.date_sorted_idx]
+    
+    def add(self, row: int, expense: Expense):
+        """Index an expense appended to the list at position row"""
+        self.by_category[expense.category].append(row)
+        pos = bisect_right(self.dates_sorted, expense.date)
+        self.dates_sorted.insert(pos, expense.date)
+        self.date_sorted_idx.insert(pos, row)
+    
+    def category_rows(self, category: str) -> List[int]:
+        """Row ids of expenses in a category"""
+        return self.by_category.get(category, [])
+    
+    def date_range_rows(self, start_date: str = '', end_date: str = '') -> List[int]:
+        """Row ids of expenses dated within [start_date, end_date], in date order"""
+        lo = bisect_left(self.dates_sorted, start_date) if start_date else 0
+        hi = bisect_right(self.dates_sorted, end_date) if end_date else len(self.dates_sorted)
+        return self.date_sorted_idx[lo:hi]
+    
+    def month_rows(self, year: int, month: int) -> List[int]:
+        """Row ids of expenses in a calendar month, in date order"""
+        start = f"{year:04d}-{month:02d}-01"
+        end = f"{year + month // 12:04d}-{month % 12 + 1:02d}-01"
+        lo = bisect_left(self.dates_sorted, start)
+        hi = bisect_left(self.dates_sorted, end, lo)
+        return self.date_sorted_idx[lo:hi]
+
+
 class ReportGenerator:
     
     @staticmethod
     def generate_summary(expenses: List[Expense]) -> Dict:
         """Generate overall summary statistics"""
-        if not expenses:
-            return {'total': 0, 'count': 0, 'average': 0, 'categories': {}}
-        
-        total = sum(exp.amount for exp in expenses)
-        count = len(expenses)
-        average = total / count
-        
+        return ReportGenerator._summarize_iter(expenses)
+    
+    @staticmethod
+    def _summarize_iter(expenses: Iterable[Expense]) -> Dict:
+        """Summarize expenses in one pass without materializing them"""
+        total = 0.0
+        count = 0
         categories = defaultdict(float)
         for exp in expenses:
-            categories[exp.category] += exp.amount
+            amount = exp.amount
+            total += amount
+            count += 1
+            categories[exp.category] += amount
+        
+        if not count:
+            return {'total': 0, 'count': 0, 'average': 0, 'categories': {}}
         
         return {
             'total': total,
             'count': count,
-            'average': average,
+            'average': total / count,
             'categories': dict(categories)
         }
     
     @staticmethod
-    def generate_monthly_report(expenses: List[Expense], year: int, month: int) -> Dict:
+    def generate_monthly_report(expenses: List[Expense], year: int, month: int,
+                                index: Optional[ExpenseIndex] = None) -> Dict:
         """Generate report for a specific month"""
-        monthly_expenses = [
+        if index is not None:
+            # List order, matching the scan below exactly, float sums included
+            rows = sorted(index.month_rows(year, month))
+            return ReportGenerator._summarize_iter(expenses[i] for i in rows)
+        
+        return ReportGenerator._summarize_iter(
             exp for exp in expenses
-            if datetime.strptime(exp.date, '%Y-%m-%d').year == year
-            and datetime.strptime(exp.date, '%Y-%m-%d').month == month
-        ]
-        return ReportGenerator.generate_summary(monthly_expenses)
+            if exp._year == year and exp._month == month
+        )
     
     @staticmethod
     def get_top_expenses(expenses: List[Expense], n: int = 5) -> List[Expense]:
         """Get top N expenses by amount"""
-        return sorted(expenses, key=lambda x: x.amount, reverse=True)[:n]
+        return heapq.nlargest(n, expenses, key=_by_amount)
     
     @staticmethod
     def search_expenses(expenses: List[Expense], keyword: str = '', 
-                       category: str = '', start_date: str = '', end_date: str = '') -> List[Expense]:
+                       category: str = '', start_date: str = '', end_date: str = '',
+                       index: Optional[ExpenseIndex] = None) -> List[Expense]:
         """Search expenses by various criteria"""
+        if index is not None and (category or start_date or end_date):
+            return ReportGenerator._search_indexed(expenses, index, keyword, category, start_date, end_date)
+        
         results = expenses
         
         if keyword:
-            results = [exp for exp in results if keyword.lower() in exp.description.lower()]
+            keyword = keyword.lower()
+            results = [exp for exp in results if keyword in exp._desc_lower]
         
         if category:
             results = [exp for exp in results if exp.category == category]
@@ -196,6 +393,27 @@ class ReportGenerator:
             results = [exp for exp in results if exp.date <= end_date]
         
         return results
+    
+    @staticmethod
+    def _search_indexed(expenses: List[Expense], index: ExpenseIndex, keyword: str,
+                        category: str, start_date: str, end_date: str) -> List[Expense]:
+        """Narrow candidates with the category and date indexes before the keyword scan"""
+        rows = None
+        
+        if category:
+            rows = index.category_rows(category)
+        
+        if start_date or end_date:
+            in_range = index.date_range_rows(start_date, end_date)
+            rows = in_range if rows is None else set(rows).intersection(in_range)
+        
+        results = [expenses[i] for i in sorted(rows)]
+        
+        if keyword:
+            keyword = keyword.lower()
+            results = [exp for exp in results if keyword in exp._desc_lower]
+        
+        return results
 
 
 class FinanceManagerUI:
@@ -204,11 +422,53 @@ class FinanceManagerUI:
     def __init__(self):
         self.file_manager = FileManager(filename='data/expenses.csv')
         self.expenses = self.file_manager.load_expenses()
+        self.index = ExpenseIndex(self.expenses)
         self.report_gen = ReportGenerator()
+        self._summary = self.report_gen.generate_summary(self.expenses)
+        self._sorted_cache = []
+        self._sorted_dirty = True
+        self._vt_enabled = False
+    
+    def _get_sorted(self) -> List[Expense]:
+        """Expenses newest first, re-sorted only after the list changes"""
+        if self._sorted_dirty:
+            self._sorted_cache = sorted(self.expenses, key=_by_date, reverse=True)
+            self._sorted_dirty = False
+        return self._sorted_cache
+    
+    def _apply_delta(self, expense: Expense, sign: int):
+        """Fold an added (+1) or deleted (-1) expense into the running summary"""
+        summary = self._summary
+        categories = summary['categories']
+        summary['count'] += sign
+        
+        if summary['count'] == 0:
+            summary.update(total=0, average=0)
+            categories.clear()
+            return
+        
+        summary['total'] += sign * expense.amount
+        summary['average'] = summary['total'] / summary['count']
+        
+        remaining = categories.get(expense.category, 0.0) + sign * expense.amount
+        # Amounts are positive and rounded to 2 places, so anything below half
+        # a paisa is floating-point residue from removing the last entry
+        if remaining < 0.005:
+            categories.pop(expense.category, None)
+        else:
+            categories[expense.category] = remaining
     
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            if sys.getwindowsversion().major < 10:
+                os.system('cls')
+                return
+            if not self._vt_enabled:
+                os.system('')  # enables ANSI escape processing in the Windows console
+                self._vt_enabled = True
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
     
     def print_header(self):
         """Print application header"""
@@ -252,7 +512,15 @@ class FinanceManagerUI:
             
             expense = Expense(amount, category, date, description)
             self.expenses.append(expense)
-            self.file_manager.save_expenses(self.expenses)
+            self.index.add(len(self.expenses) - 1, expense)
+            self._apply_delta(expense, +1)
+            self._sorted_dirty = True
+            # Appending is only safe under our own header; otherwise rewrite
+            # the file in HEADER order, as every add did before
+            if self.file_manager.has_standard_header:
+                self.file_manager.append_expense(expense)
+            else:
+                self.file_manager.save_expenses(self.expenses)
             
             print("\n✅ Expense added successfully!")
             
@@ -274,10 +542,10 @@ class FinanceManagerUI:
         print(f"{'Date':<12} | {'Category':<15} | {'Amount':>12} | {'Description'}")
         print("-" * 80)
         
-        for i, expense in enumerate(sorted(self.expenses, key=lambda x: x.date, reverse=True), 1):
-            print(f"[{i:3d}] {expense}")
+        # One write for the whole table rather than a print per row
+        print("\n".join([f"[{i:3d}] {expense}" for i, expense in enumerate(self._get_sorted(), 1)]))
         
-        summary = self.report_gen.generate_summary(self.expenses)
+        summary = self._summary
         print("-" * 80)
         print(f"Total Expenses: ₹{summary['total']:.2f} | Count: {summary['count']} | Average: ₹{summary['average']:.2f}")
     
@@ -291,7 +559,7 @@ class FinanceManagerUI:
             print("No expenses recorded yet.")
             return
         
-        summary = self.report_gen.generate_summary(self.expenses)
+        summary = self._summary
         total = summary['total']
         
         print(f"{'Category':<20} | {'Amount':>12} | {'Percentage':>10}")
@@ -319,7 +587,7 @@ class FinanceManagerUI:
                 print("❌ Invalid month. Must be between 1 and 12.")
                 return
             
-            report = self.report_gen.generate_monthly_report(self.expenses, year, month)
+            report = self.report_gen.generate_monthly_report(self.expenses, year, month, index=self.index)
             
             month_name = datetime(year, month, 1).strftime('%B %Y')
             print(f"\nReport for {month_name}")
@@ -334,7 +602,7 @@ class FinanceManagerUI:
             print(f"Average per Transaction: ₹{report['average']:.2f}")
             
             print("\nCategory Breakdown:")
-            for category, amount in sorted(report['categories'].items(), key=lambda x: x[1], reverse=True):
+            for category, amount in sorted(report['categories'].items(), key=itemgetter(1), reverse=True):
                 percentage = (amount / report['total'] * 100)
                 print(f"  {category:<20}: ₹{amount:>10.2f} ({percentage:>5.1f}%)")
         
@@ -360,7 +628,8 @@ class FinanceManagerUI:
             keyword=keyword, 
             category=category if category in Expense.CATEGORIES else '',
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            index=self.index
         )
         
         print(f"\nFound {len(results)} matching expenses:\n")
@@ -368,7 +637,7 @@ class FinanceManagerUI:
         if results:
             print(f"{'Date':<12} | {'Category':<15} | {'Amount':>12} | {'Description'}")
             print("-" * 80)
-            for expense in sorted(results, key=lambda x: x.date, reverse=True):
+            for expense in sorted(results, key=_by_date, reverse=True):
                 print(expense)
         else:
             print("No matching expenses found.")
@@ -426,6 +695,9 @@ class FinanceManagerUI:
             if 1 <= choice <= len(backups):
                 if self.file_manager.restore_from_backup(backups[choice - 1]):
                     self.expenses = self.file_manager.load_expenses()
+                    self.index = ExpenseIndex(self.expenses)
+                    self._summary = self.report_gen.generate_summary(self.expenses)
+                    self._sorted_dirty = True
             else:
                 print("❌ Invalid choice")
         except ValueError:
@@ -449,12 +721,14 @@ class FinanceManagerUI:
                 return
             
             if 1 <= choice <= len(self.expenses):
-                sorted_expenses = sorted(self.expenses, key=lambda x: x.date, reverse=True)
-                expense_to_delete = sorted_expenses[choice - 1]
+                expense_to_delete = self._get_sorted()[choice - 1]
                 
                 confirm = input(f"\nDelete: {expense_to_delete}\nAre you sure? (yes/no): ").lower()
                 if confirm == 'yes':
                     self.expenses.remove(expense_to_delete)
+                    self.index = ExpenseIndex(self.expenses)
+                    self._apply_delta(expense_to_delete, -1)
+                    self._sorted_dirty = True
                     self.file_manager.save_expenses(self.expenses)
                     print("✅ Expense deleted successfully!")
                 else: